@@ -3,7 +3,6 @@
 #![feature(type_alias_impl_trait)]
 
 use embassy_executor::Spawner;
-use embassy_time::{Duration, Timer};
 use esp_alloc as _;
 use esp_backtrace as _;
 use esp_hal::{clock::CpuClock, timer::timg::TimerGroup};
@@ -80,9 +79,9 @@ async fn main(spawner: Spawner) -> ! {
     if !config_valid {
         println!("app: no provisioned config; rebooting to factory firmware");
         firmware_usecases.boot_factory().unwrap();
-        loop {
-            Timer::after(Duration::from_secs(60)).await;
-        }
+        // The boot task resets the chip; nothing left to do until then.
+        core::future::pending::<()>().await;
+        unreachable!();
     }
     println!("app: using wifi ssid: {}", config.wifi.ssid);
     println!(
@@ -107,7 +106,7 @@ async fn main(spawner: Spawner) -> ! {
     );
     adapters::start_mqtt_client(spawner, stack, mqtt_module, config.mqtt);
 
-    loop {
-        Timer::after(Duration::from_secs(5)).await;
-    }
+    // All work happens in spawned tasks; park main without timer wakeups.
+    core::future::pending::<()>().await;
+    unreachable!();
 }
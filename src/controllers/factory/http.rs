@@ -271,6 +271,11 @@ async fn handle_ota_update(conn: &mut HttpConnection<'_>) -> HttpResult {
 }
 
 async fn serve_404(conn: &mut HttpConnection<'_>) -> HttpResult {
-    conn.write_headers(&ResponseHeaders::not_found()).await?;
-    conn.write_body(b"Not Found").await
+    const BODY: &[u8] = b"Not Found";
+    let content =
+        ContentHeaders::new(ContentType::TextPlain).with_length(BODY.len());
+    let headers = ResponseHeaders::not_found().with_content(content);
+    // Single flush for headers and body
+    conn.queue_headers(&headers).await?;
+    conn.write_body(BODY).await
 }
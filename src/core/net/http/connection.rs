@@ -22,8 +22,6 @@ use super::{
 
 const HEADER_BUFFER_SIZE: usize = 512;
 const BODY_BUFFER_SIZE: usize = 1024;
-const BODY_RX_CHUNK_SIZE: usize = 256;
-const STREAM_CHUNK_SIZE: usize = 1024;
 
 /// A trait for reading chunks from a connection.
 pub(crate) trait AsyncChunkedReader {
@@ -58,9 +56,7 @@ impl<'a> HttpConnection<'a> {
         mut socket: TcpSocket<'a>,
     ) -> Result<Self, Error> {
         let mut header_buf = Vec::<u8, HEADER_BUFFER_SIZE>::new();
-        for _ in 0..header_buf.capacity() {
-            header_buf.push(0).unwrap();
-        }
+        header_buf.resize_default(HEADER_BUFFER_SIZE).unwrap();
         let (header_end, header_len) =
             read_heading(header_buf.as_mut_slice(), &mut socket).await?;
         header_buf.truncate(header_len);
@@ -98,29 +94,41 @@ impl<'a> HttpConnection<'a> {
     pub(crate) async fn write_headers(
         &mut self,
         headers: &ResponseHeaders,
+    ) -> HttpResult {
+        self.queue_headers(headers).await?;
+        self.socket.flush().await?;
+
+        Ok(())
+    }
+
+    /// Write the headers to the connection without flushing.
+    ///
+    /// The caller must follow up with a flushing write, e.g. `write_body`.
+    pub(crate) async fn queue_headers(
+        &mut self,
+        headers: &ResponseHeaders,
     ) -> HttpResult {
         self.header_buf.clear();
         headers.write_to(&mut self.header_buf)?;
-        self.write_header_buf().await
+        self.socket.write_all(self.header_buf.as_slice()).await?;
+
+        Ok(())
     }
 
     /// Write the body to the connection
     pub(crate) async fn write_body(&mut self, body: &[u8]) -> HttpResult {
         #[cfg(feature = "log")]
         println!("http: writing body: length={}", body.len());
-        for chunk in body.chunks(STREAM_CHUNK_SIZE) {
-            self.write_all(chunk).await?;
-        }
-        Ok(())
+        // Let the socket fill whole TX-buffer segments and wait for the ACK
+        // once, instead of flushing after every small chunk.
+        self.write_all(body).await
     }
 
     /// Write JSON to the connection
     ///
     /// Writes both headers and body.
     pub(crate) async fn write_json<T: Serialize>(&mut self, data: &T) -> HttpResult {
-        for _ in 0..self.body_buf.capacity() {
-            self.body_buf.push(0).unwrap();
-        }
+        self.body_buf.resize_default(BODY_BUFFER_SIZE).unwrap();
         #[cfg(feature = "log")]
         println!("http: writing JSON: length={}", self.body_buf.len());
         let n = serde_json_core::to_slice(data, self.body_buf.as_mut_slice())
@@ -129,9 +137,10 @@ impl<'a> HttpConnection<'a> {
         let headers = ResponseHeaders::success()
             .with_content(ContentHeaders::new(ContentType::Json).with_length(n));
 
-        self.write_headers(&headers).await?;
         #[cfg(feature = "log")]
-        println!("http: writing headers: length={}", self.header_buf.len());
+        println!("http: writing headers");
+        // Headers go out together with the body, flushed only once
+        self.queue_headers(&headers).await?;
 
         self.write_body_buf().await?;
         #[cfg(feature = "log")]
@@ -165,42 +174,37 @@ impl<'a> HttpConnection<'a> {
         Ok(())
     }
 
-    /// Write the header buffer to the connection
-    async fn write_header_buf(&mut self) -> HttpResult {
-        self.socket.write_all(self.header_buf.as_slice()).await?;
-        self.socket.flush().await?;
-
-        Ok(())
-    }
-
     /// Read the request body
     async fn read_body(&mut self) -> Result<&[u8], Error> {
         if self.content_length == 0 {
             return Err(Error::NoData);
         }
+        if self.content_length as usize > BODY_BUFFER_SIZE {
+            return Err(Error::TooLarge);
+        }
 
         self.body_buf.clear();
 
         if self.header_buf.len() > self.header_end {
-            let tail_len = self.header_buf.len() - self.header_end;
-            for i in 0..tail_len {
-                self.body_buf
-                    .push(self.header_buf[self.header_end + i])
-                    .unwrap();
-            }
+            self.body_buf
+                .extend_from_slice(&self.header_buf[self.header_end..])
+                .unwrap();
         }
 
-        // Read remaining body
-        while self.body_buf.len() < self.content_length as usize {
-            let mut buf = [0u8; BODY_RX_CHUNK_SIZE];
-            let n = self.socket.read(&mut buf).await?;
+        // Read remaining body directly into `body_buf`
+        let body_len = self.content_length as usize;
+        let mut len = self.body_buf.len().min(body_len);
+        self.body_buf.resize_default(body_len).unwrap();
+        while len < body_len {
+            let n = self.socket.read(&mut self.body_buf[len..]).await?;
             if n == 0 {
                 break;
             }
-            self.body_buf.extend_from_slice(&buf[..n]).unwrap();
+            len += n;
         }
+        self.body_buf.truncate(len);
 
-        Ok(&self.body_buf.as_slice()[..self.body_buf.len()])
+        Ok(self.body_buf.as_slice())
     }
 }
 
@@ -220,7 +224,8 @@ impl AsyncChunkedReader for HttpConnection<'_> {
     #[allow(clippy::cast_possible_truncation)]
     async fn read_and_then(&mut self, op: impl FnOnce(&[u8])) -> HttpResult {
         if self.content_length == 0 {
-            esp_println::println!("http: content_length is 0, returning NoData");
+            #[cfg(feature = "log")]
+            println!("http: content_length is 0, returning NoData");
             return Err(Error::NoData);
         }
 
@@ -228,42 +233,34 @@ impl AsyncChunkedReader for HttpConnection<'_> {
             op(&[]);
             return Ok(());
         }
-        self.body_buf.clear();
 
         if self.header_buf.len() > self.header_end {
-            let trailer_len = self.header_buf.len() - self.header_end;
-            for i in self.header_end..self.header_buf.len() {
-                self.body_buf.push(self.header_buf[i]).unwrap();
-            }
-            self.header_buf.truncate(self.header_end);
-            self.received += self.body_buf.len() as u32;
-            esp_println::println!(
+            let trailer = &self.header_buf[self.header_end..];
+            self.received += trailer.len() as u32;
+            #[cfg(feature = "log")]
+            println!(
                 "http: header trailer {} bytes, received={}",
-                trailer_len,
+                trailer.len(),
                 self.received
             );
 
-            op(self.body_buf.as_slice());
+            op(trailer);
+            self.header_buf.truncate(self.header_end);
             return Ok(());
         }
 
-        for _ in 0..self.body_buf.capacity() - self.body_buf.len() {
-            self.body_buf.push(0).unwrap();
-        }
-
-        let n = self.socket.read(self.body_buf.as_mut_slice()).await?;
-        if n == 0 {
-            esp_println::println!(
-                "http: socket returned 0, received={}/{}",
-                self.received,
-                self.content_length
-            );
-            op(&[]);
-            return Ok(());
-        }
+        // Hand the socket RX buffer to the consumer directly instead of copying
+        // it into `body_buf` first.
+        let remaining = (self.content_length - self.received) as usize;
+        let n = self
+            .socket
+            .read_with(|buf| {
+                let n = buf.len().min(remaining);
+                op(&buf[..n]);
+                (n, n)
+            })
+            .await?;
         self.received += n as u32;
-        self.body_buf.truncate(n);
-        op(self.body_buf.as_slice());
 
         Ok(())
     }
@@ -42,6 +42,7 @@ impl ContentEncoding {
 pub(crate) enum ContentType {
     Json,
     TextHtml,
+    TextPlain,
 }
 
 /// Text Encoding.
@@ -65,6 +66,7 @@ impl ContentType {
         match self {
             ContentType::Json => "application/json",
             ContentType::TextHtml => "text/html",
+            ContentType::TextPlain => "text/plain",
         }
     }
 }
@@ -317,10 +319,12 @@ pub(super) async fn read_heading(
 pub(super) fn find_content_length(header: &str) -> Option<u32> {
     const TARGET: &str = "content-length:";
     for line in header.lines() {
-        let lower = line.to_ascii_lowercase();
-        if lower.starts_with(TARGET) {
+        // Compare in place to avoid allocating a lowercased copy of each line
+        let name = line.get(..TARGET.len());
+        if name.is_some_and(|name| name.eq_ignore_ascii_case(TARGET)) {
             let value_str = line[TARGET.len()..].trim();
             let length = value_str.parse::<u64>().ok()?;
+            #[cfg(feature = "log")]
             esp_println::println!("http: found Content-Length: {}", length);
             if length > u64::from(u32::MAX) {
                 return None;
@@ -328,6 +332,7 @@ pub(super) fn find_content_length(header: &str) -> Option<u32> {
             return Some(length as u32);
         }
     }
+    #[cfg(feature = "log")]
     esp_println::println!("http: Content-Length header not found");
     None
 }
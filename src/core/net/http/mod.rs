@@ -18,6 +18,8 @@ pub enum Error {
     Closed,
     Parse,
     NoData,
+    /// Request body does not fit into the connection buffer
+    TooLarge,
     FormatHeaders,
 }
 
@@ -44,6 +44,7 @@ impl<T: HttpHandler + ?Sized, const TX_SIZE: usize, const RX_SIZE: usize>
         loop {
             let mut socket = TcpSocket::new(stack, rx_buffer, tx_buffer);
             socket.set_timeout(Some(Duration::from_secs(30)));
+            socket.set_nagle_enabled(false);
 
             if socket.accept(port).await.is_err() {
                 continue;
@@ -12,6 +12,8 @@ pub enum FirmwareError {
     AlreadyBooting,
     Busy,
     Erase,
+    /// The firmware image does not fit into the target partition
+    TooLarge,
     InvalidPartitionTable,
     Write,
     Read,
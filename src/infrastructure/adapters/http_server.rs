@@ -5,8 +5,8 @@
 //! 2. Initializes the `HttpServer` with the provided handler.
 //! 3. Runs the `listen_and_serve` loop.
 //!
-//! This function is not an Embassy task itself; it is meant to be called from
-//! a task (e.g. `factory_http_server_task`) or directly from `main` if appropriate.
+//! This function is not an Embassy task itself; the factory firmware runs it
+//! inline at the end of `main`, so no extra task stack is needed.
 
 use embassy_net::Stack;
 use esp_println::println;
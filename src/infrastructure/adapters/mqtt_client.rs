@@ -1,7 +1,12 @@
 use embassy_executor::Spawner;
-use embassy_net::{IpAddress, Stack, dns::DnsQueryType, tcp::TcpSocket};
+use embassy_net::{
+    IpAddress,
+    Stack,
+    dns::DnsQueryType,
+    tcp::{ConnectError, TcpSocket},
+};
 use embassy_sync::channel::Channel;
-use embassy_time::Duration;
+use embassy_time::{Duration, with_timeout};
 #[cfg(feature = "log")]
 use esp_println::println;
 use heapless::String;
@@ -19,6 +24,9 @@ use crate::{
 const MQTT_OUTBOX_DEPTH: usize = 4;
 const MQTT_MAX_TOPICS: usize = 8;
 const MQTT_BUF_SIZE: usize = 2048;
+/// Upper bound for the TCP handshake with the broker. Without it a lost
+/// SYN is only reported after the 60 s socket timeout.
+const MQTT_CONNECT_TIMEOUT: Duration = Duration::from_secs(10);
 
 static PUBLISH_CHANNEL: PublishRequestChannel<'static, MQTT_OUTBOX_DEPTH> =
     Channel::new();
@@ -76,6 +84,9 @@ async fn run_mqtt_client(
 ) -> Result<(), ()> {
     let mut socket = TcpSocket::new(stack, rx_buffer, tx_buffer);
     socket.set_timeout(Some(Duration::from_secs(60)));
+    // MQTT traffic is small request/response packets; don't hold them back
+    // waiting to coalesce.
+    socket.set_nagle_enabled(false);
 
     let broker_addr = resolve_host(stack, mqtt_config.host.as_str()).await?;
 
@@ -85,7 +96,12 @@ async fn run_mqtt_client(
         broker_addr, mqtt_config.port
     );
 
-    let connection_result = socket.connect((broker_addr, mqtt_config.port)).await;
+    let connection_result = with_timeout(
+        MQTT_CONNECT_TIMEOUT,
+        socket.connect((broker_addr, mqtt_config.port)),
+    )
+    .await
+    .unwrap_or(Err(ConnectError::TimedOut));
     if let Err(_e) = connection_result {
         socket.abort();
         #[cfg(feature = "log")]
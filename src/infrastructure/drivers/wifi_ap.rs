@@ -76,12 +76,7 @@ pub async fn start_wifi_ap(
         .ok();
     spawner.spawn(factory_network_runner_task(runner)).ok();
 
-    loop {
-        if stack.is_link_up() {
-            break;
-        }
-        Timer::after(Duration::from_millis(100)).await;
-    }
+    stack.wait_link_up().await;
     // Give some extra time
     Timer::after(Duration::from_millis(100)).await;
 
@@ -115,10 +110,9 @@ pub async fn factory_wifi_ap_task(
     #[cfg(feature = "log")]
     println!("factory_wifi: AP started");
 
-    // Keep the AP running
-    loop {
-        embassy_time::Timer::after(embassy_time::Duration::from_secs(60)).await;
-    }
+    // Keep the AP running: the controller must stay alive, but there is
+    // nothing to poll.
+    core::future::pending::<()>().await;
 }
 
 /// DHCP server task
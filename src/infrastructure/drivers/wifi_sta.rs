@@ -107,21 +107,10 @@ pub async fn network_runner_task(mut runner: Runner<'static, WifiDevice<'static>
 }
 
 /// Wait for full network connectivity (link + IP address)
-/// Returns the obtained IPv4 configuration
-async fn wait_for_connection(stack: Stack<'_>) -> embassy_net::StaticConfigV4 {
+async fn wait_for_connection(stack: Stack<'_>) {
     // Wait for the network link to become active
-    loop {
-        if stack.is_link_up() {
-            break;
-        }
-        Timer::after(Duration::from_millis(100)).await;
-    }
+    stack.wait_link_up().await;
 
     // Wait for the network stack to obtain an IPv4 address via DHCP
-    loop {
-        if let Some(config) = stack.config_v4() {
-            return config;
-        }
-        Timer::after(Duration::from_millis(100)).await;
-    }
+    stack.wait_config_up().await;
 }
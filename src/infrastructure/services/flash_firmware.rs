@@ -76,16 +76,13 @@ impl HttpFirmwareUpdater for FirmwareService {
 
             let part_capacity =
                 u32::try_from(partition.capacity()).unwrap_or(u32::MAX);
-            let erase_size = content_length.saturating_add(ERASE_SECTOR - 1)
-                / ERASE_SECTOR
-                * ERASE_SECTOR;
-            let erase_size = erase_size.min(part_capacity);
-            #[cfg(feature = "log")]
-            println!("ota: erasing {} bytes", erase_size);
-            if partition.erase(0, erase_size).is_err() {
-                return Err(FirmwareError::Erase);
+            if content_length > part_capacity {
+                return Err(FirmwareError::TooLarge);
             }
 
+            // Sectors are erased lazily just ahead of the write cursor, so the
+            // socket keeps draining instead of stalling on a whole-image erase.
+            let mut erased: u32 = 0;
             let mut written: u32 = 0;
             let mut received: usize = 0;
             let mut tail = [0xFFu8; ALIGN];
@@ -93,6 +90,7 @@ impl HttpFirmwareUpdater for FirmwareService {
             let mut first_bytes: [u8; 4] = [0; 4];
             let mut chunk_count: u32 = 0;
 
+            let mut write_error: Option<FirmwareError> = None;
             let mut is_eof = false;
             while !is_eof {
                 conn.read_and_then(|chunk| {
@@ -103,14 +101,18 @@ impl HttpFirmwareUpdater for FirmwareService {
                         if received == 0 && chunk.len() >= 4 {
                             first_bytes.copy_from_slice(&chunk[..4]);
                         }
-                        write_aligned_data(
+                        if let Err(e) = write_aligned_data(
                             &mut partition,
                             chunk,
+                            &mut erased,
                             &mut written,
                             &mut tail,
                             &mut tail_len,
-                        )
-                        .unwrap();
+                        ) {
+                            write_error = Some(e);
+                            is_eof = true;
+                            return;
+                        }
                         received += chunk.len();
                         chunk_count += 1;
                     }
@@ -118,6 +120,9 @@ impl HttpFirmwareUpdater for FirmwareService {
                 .await
                 .map_err(|_| FirmwareError::Read)?;
             }
+            if let Some(e) = write_error {
+                return Err(e);
+            }
 
             #[cfg(feature = "log")]
             println!(
@@ -134,6 +139,7 @@ impl HttpFirmwareUpdater for FirmwareService {
             if tail_len > 0 {
                 #[cfg(feature = "log")]
                 println!("ota: writing final tail of {} bytes", tail_len);
+                erase_up_to(&mut partition, &mut erased, written + 4)?;
                 partition
                     .write(written, &tail)
                     .map_err(|_| FirmwareError::Write)?;
@@ -193,10 +199,30 @@ async fn boot_to_sector_task() {
     esp_hal::system::software_reset();
 }
 
+/// Erase whole sectors from `erased` until at least `end` bytes are writable.
+fn erase_up_to<F: embedded_storage::nor_flash::NorFlash>(
+    partition: &mut F,
+    erased: &mut u32,
+    end: u32,
+) -> Result<(), FirmwareError> {
+    if end <= *erased {
+        return Ok(());
+    }
+    let erase_end = end.div_ceil(ERASE_SECTOR) * ERASE_SECTOR;
+    #[cfg(feature = "log")]
+    println!("ota: erasing {}..{}", *erased, erase_end);
+    partition
+        .erase(*erased, erase_end)
+        .map_err(|_| FirmwareError::Erase)?;
+    *erased = erase_end;
+    Ok(())
+}
+
 #[allow(clippy::cast_possible_truncation)]
 fn write_aligned_data<F: embedded_storage::nor_flash::NorFlash>(
     partition: &mut F,
     data: &[u8],
+    erased: &mut u32,
     written: &mut u32,
     tail: &mut [u8; 4],
     tail_len: &mut usize,
@@ -212,6 +238,7 @@ fn write_aligned_data<F: embedded_storage::nor_flash::NorFlash>(
         idx += take;
 
         if *tail_len == 4 {
+            erase_up_to(partition, erased, *written + 4)?;
             partition
                 .write(*written, tail)
                 .map_err(|_| FirmwareError::Flash)?;
@@ -225,6 +252,7 @@ fn write_aligned_data<F: embedded_storage::nor_flash::NorFlash>(
     let rem = &data[idx..];
     let aligned_len = rem.len() & !3;
     if aligned_len > 0 {
+        erase_up_to(partition, erased, *written + aligned_len as u32)?;
         partition
             .write(*written, &rem[..aligned_len])
             .map_err(|_| FirmwareError::Flash)?;